@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable, MutableMapping
+
+
+@dataclass
+class _Node:
+    children: MutableMapping[str, _Node] = field(default_factory=dict)
+    terminal: bool = False
+
+
+class PathTrie:
+    """
+    Set of paths, keyed by `PurePath.parts`
+    """
+
+    def __init__(self) -> None:
+        self._root = _Node()
+
+    def insert(self, parts: Iterable[str]) -> None:
+        node = self._root
+        for part in parts:
+            if (child := node.children.get(part)) is None:
+                child = node.children[part] = _Node()
+            node = child
+        node.terminal = True
+
+    def contains_prefix(self, parts: Iterable[str]) -> bool:
+        """
+        Is any stored path equal to, or an ancestor of `parts`
+        """
+
+        node = self._root
+        for part in parts:
+            if node.terminal:
+                return True
+            elif (child := node.children.get(part)) is None:
+                return False
+            else:
+                node = child
+        return node.terminal
@@ -0,0 +1,243 @@
+from ctypes import (
+    CDLL,
+    POINTER,
+    Array,
+    Structure,
+    byref,
+    c_char,
+    c_char_p,
+    c_int,
+    c_int32,
+    c_int64,
+    c_uint,
+    c_uint16,
+    c_uint32,
+    c_uint64,
+    c_void_p,
+    create_string_buffer,
+    memset,
+)
+from ctypes.util import find_library
+from errno import EINTR
+from functools import lru_cache
+from os import fsencode, makedev, stat_result
+from pathlib import PurePath
+from threading import local
+from typing import Any, MutableSequence, Optional, Sequence
+
+from std2.platform import OS, os
+
+# liburing only exports its inline helpers (get_sqe, prep_statx, ...) from the ffi build
+_LIB_NAME = "uring-ffi"
+
+_AT_FDCWD = -100
+_AT_SYMLINK_NOFOLLOW = 0x100
+_STATX_BASIC_STATS = 0x7FF
+
+_RING_ENTRIES = 128
+# opaque `struct io_uring`, ~ 200 bytes depending on liburing version
+# the upper half is a canary, checked after init
+_RING_SIZE = 4096
+_CANARY = 0xA5
+
+
+class _StatxTimestamp(Structure):
+    _fields_ = (
+        ("tv_sec", c_int64),
+        ("tv_nsec", c_uint32),
+        ("reserved", c_int32),
+    )
+
+
+class _Statx(Structure):
+    _fields_ = (
+        ("stx_mask", c_uint32),
+        ("stx_blksize", c_uint32),
+        ("stx_attributes", c_uint64),
+        ("stx_nlink", c_uint32),
+        ("stx_uid", c_uint32),
+        ("stx_gid", c_uint32),
+        ("stx_mode", c_uint16),
+        ("spare0", c_uint16),
+        ("stx_ino", c_uint64),
+        ("stx_size", c_uint64),
+        ("stx_blocks", c_uint64),
+        ("stx_attributes_mask", c_uint64),
+        ("stx_atime", _StatxTimestamp),
+        ("stx_btime", _StatxTimestamp),
+        ("stx_ctime", _StatxTimestamp),
+        ("stx_mtime", _StatxTimestamp),
+        ("stx_rdev_major", c_uint32),
+        ("stx_rdev_minor", c_uint32),
+        ("stx_dev_major", c_uint32),
+        ("stx_dev_minor", c_uint32),
+        ("spare2", c_uint64 * 14),
+    )
+
+
+class _Cqe(Structure):
+    _fields_ = (
+        ("user_data", c_uint64),
+        ("res", c_int32),
+        ("flags", c_uint32),
+    )
+
+
+# `find_library` shells out to `ldconfig` / `gcc`, defer it until io_uring is needed
+@lru_cache(maxsize=None)
+def _lib() -> Optional[CDLL]:
+    if os is not OS.linux:
+        return None
+    elif not (name := find_library(_LIB_NAME)):
+        return None
+    else:
+        try:
+            lib = CDLL(name)
+            lib.io_uring_queue_init.argtypes = (c_uint, c_void_p, c_uint)
+            lib.io_uring_queue_init.restype = c_int
+            lib.io_uring_queue_exit.argtypes = (c_void_p,)
+            lib.io_uring_queue_exit.restype = None
+            lib.io_uring_get_sqe.argtypes = (c_void_p,)
+            lib.io_uring_get_sqe.restype = c_void_p
+            lib.io_uring_prep_statx.argtypes = (
+                c_void_p,
+                c_int,
+                c_char_p,
+                c_int,
+                c_uint,
+                POINTER(_Statx),
+            )
+            lib.io_uring_prep_statx.restype = None
+            lib.io_uring_sqe_set_data64.argtypes = (c_void_p, c_uint64)
+            lib.io_uring_sqe_set_data64.restype = None
+            lib.io_uring_submit.argtypes = (c_void_p,)
+            lib.io_uring_submit.restype = c_int
+            lib.io_uring_wait_cqe.argtypes = (c_void_p, POINTER(POINTER(_Cqe)))
+            lib.io_uring_wait_cqe.restype = c_int
+            lib.io_uring_cqe_seen.argtypes = (c_void_p, POINTER(_Cqe))
+            lib.io_uring_cqe_seen.restype = None
+        except (OSError, AttributeError):
+            return None
+        else:
+            return lib
+
+
+_LOCAL = local()
+# buffers of requests that were never reaped, the kernel may still write to them
+_IN_FLIGHT: MutableSequence[Any] = []
+
+
+def _ring(lib: CDLL) -> Optional["Array[c_char]"]:
+    # rings are not thread safe, one per worker thread, kept for its lifetime
+    if not hasattr(_LOCAL, "ring"):
+        buf = (c_char * _RING_SIZE)()
+        memset(buf, _CANARY, _RING_SIZE)
+        if lib.io_uring_queue_init(_RING_ENTRIES, buf, 0) != 0:
+            _LOCAL.ring = None
+        elif buf.raw[_RING_SIZE // 2 :] != bytes((_CANARY,)) * (_RING_SIZE // 2):
+            lib.io_uring_queue_exit(buf)
+            _LOCAL.ring = None
+        else:
+            _LOCAL.ring = buf
+    ring: Optional["Array[c_char]"] = _LOCAL.ring
+    return ring
+
+
+def _drop(lib: CDLL, ring: "Array[c_char]") -> None:
+    # also discards any sqe that was prepared but never submitted
+    lib.io_uring_queue_exit(ring)
+    _LOCAL.ring = None
+
+
+def _conv(stx: _Statx) -> stat_result:
+    atime, mtime, ctime = stx.stx_atime, stx.stx_mtime, stx.stx_ctime
+    return stat_result(
+        (
+            stx.stx_mode,
+            stx.stx_ino,
+            makedev(stx.stx_dev_major, stx.stx_dev_minor),
+            stx.stx_nlink,
+            stx.stx_uid,
+            stx.stx_gid,
+            stx.stx_size,
+            atime.tv_sec,
+            mtime.tv_sec,
+            ctime.tv_sec,
+        ),
+        {
+            "st_atime": atime.tv_sec + atime.tv_nsec / 1e9,
+            "st_mtime": mtime.tv_sec + mtime.tv_nsec / 1e9,
+            "st_ctime": ctime.tv_sec + ctime.tv_nsec / 1e9,
+            "st_atime_ns": atime.tv_sec * 10**9 + atime.tv_nsec,
+            "st_mtime_ns": mtime.tv_sec * 10**9 + mtime.tv_nsec,
+            "st_ctime_ns": ctime.tv_sec * 10**9 + ctime.tv_nsec,
+            "st_blksize": stx.stx_blksize,
+            "st_blocks": stx.stx_blocks,
+            "st_rdev": makedev(stx.stx_rdev_major, stx.stx_rdev_minor),
+        },
+    )
+
+
+def _submit(
+    lib: CDLL, ring: "Array[c_char]", paths: Sequence[PurePath]
+) -> Optional[Sequence[Optional[stat_result]]]:
+    names = tuple(create_string_buffer(fsencode(path)) for path in paths)
+    bufs = tuple(_Statx() for _ in paths)
+    acc: MutableSequence[Optional[stat_result]] = [None] * len(paths)
+
+    for idx, (name, buf) in enumerate(zip(names, bufs)):
+        if not (sqe := lib.io_uring_get_sqe(ring)):
+            return None
+        else:
+            lib.io_uring_prep_statx(
+                sqe,
+                _AT_FDCWD,
+                name,
+                _AT_SYMLINK_NOFOLLOW,
+                _STATX_BASIC_STATS,
+                byref(buf),
+            )
+            lib.io_uring_sqe_set_data64(sqe, idx)
+
+    submitted = lib.io_uring_submit(ring)
+    reaped = 0
+    cqe = POINTER(_Cqe)()
+    while reaped < submitted:
+        if (code := lib.io_uring_wait_cqe(ring, byref(cqe))) == -EINTR:
+            continue
+        elif code < 0:
+            break
+        else:
+            idx, res = cqe.contents.user_data, cqe.contents.res
+            lib.io_uring_cqe_seen(ring, cqe)
+            reaped += 1
+            if res >= 0:
+                acc[idx] = _conv(bufs[idx])
+
+    if submitted == reaped == len(paths):
+        return acc
+    else:
+        # kernel is not done with these, they must outlive the ring
+        _IN_FLIGHT.append((names, bufs))
+        return None
+
+
+def batch_stat(paths: Sequence[PurePath]) -> Optional[Sequence[Optional[stat_result]]]:
+    """
+    lstat in batches, None if io_uring is unavailable
+    """
+
+    if not (lib := _lib()) or not (ring := _ring(lib)):
+        return None
+    else:
+        acc: MutableSequence[Optional[stat_result]] = []
+        for offset in range(0, len(paths), _RING_ENTRIES):
+            batch = paths[offset : offset + _RING_ENTRIES]
+            if (stats := _submit(lib, ring=ring, paths=batch)) is None:
+                # ring is left in an unknown state, stop using it on this thread
+                _drop(lib, ring=ring)
+                return None
+            else:
+                acc.extend(stats)
+
+        return acc
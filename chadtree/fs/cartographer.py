@@ -1,19 +1,24 @@
-from asyncio import Queue, gather
+from asyncio import Queue, gather, get_running_loop
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
+from errno import ELOOP
 from fnmatch import fnmatch
+from os import DirEntry, cpu_count, scandir, stat, stat_result
 from os.path import normcase
-from os import scandir, stat, stat_result
 from pathlib import Path, PurePath
 from stat import (
+    S_IFBLK,
+    S_IFCHR,
+    S_IFDIR,
     S_IFDOOR,
-    S_ISBLK,
-    S_ISCHR,
+    S_IFIFO,
+    S_IFMT,
+    S_IFREG,
+    S_IFSOCK,
     S_ISDIR,
-    S_ISFIFO,
     S_ISGID,
     S_ISLNK,
     S_ISREG,
-    S_ISSOCK,
     S_ISUID,
     S_ISVTX,
     S_IWOTH,
@@ -22,27 +27,30 @@ from stat import (
 from typing import (
     AbstractSet,
     AsyncIterator,
+    Callable,
+    FrozenSet,
     Iterable,
     Iterator,
     Mapping,
     MutableMapping,
+    MutableSequence,
     Optional,
     Sequence,
     Tuple,
+    TypeVar,
     cast,
 )
 
-from std2.asyncio import to_thread
 from std2.itertools import chunk
 
 from ..consts import WALK_PARALLELISM_FACTOR
 from ..state.types import Index
+from ._uring_stat import batch_stat
 from .ops import ancestors, lock
-from .types import Ignored, Mode, Node
+from .types import Ignored, Mode, Node, StatCache
 
 _FILE_MODES: Mapping[int, Mode] = {
     S_IXUSR: Mode.executable,
-    S_IFDOOR: Mode.door,
     S_ISGID: Mode.set_gid,
     S_ISUID: Mode.set_uid,
     S_ISVTX: Mode.sticky,
@@ -50,80 +58,190 @@ _FILE_MODES: Mapping[int, Mode] = {
     S_IWOTH | S_ISVTX: Mode.sticky_other_writable,
 }
 
+_FILE_TYPES: Mapping[int, Mode] = {
+    S_IFDIR: Mode.folder,
+    S_IFREG: Mode.file,
+    S_IFIFO: Mode.pipe,
+    S_IFSOCK: Mode.socket,
+    S_IFCHR: Mode.char_device,
+    S_IFBLK: Mode.block_device,
+    S_IFDOOR: Mode.door,
+}
+
+
+def _perm_lut() -> Sequence[FrozenSet[Mode]]:
+    # 4096 entries, but only a handful of distinct sets
+    interned: MutableMapping[FrozenSet[Mode], FrozenSet[Mode]] = {}
 
-def _fs_modes(stat: stat_result) -> Iterator[Mode]:
-    st_mode = stat.st_mode
-    if S_ISDIR(st_mode):
-        yield Mode.folder
-    if S_ISREG(st_mode):
-        yield Mode.file
-    if S_ISFIFO(st_mode):
-        yield Mode.pipe
-    if S_ISSOCK(st_mode):
-        yield Mode.socket
-    if S_ISCHR(st_mode):
-        yield Mode.char_device
-    if S_ISBLK(st_mode):
-        yield Mode.block_device
-    if stat.st_nlink > 1:
-        yield Mode.multi_hardlink
-    for bit, mode in _FILE_MODES.items():
-        if bit and st_mode & bit == bit:
-            yield mode
-
-
-async def _fs_stat(path: PurePath) -> Tuple[AbstractSet[Mode], Optional[PurePath]]:
-    def cont() -> Tuple[AbstractSet[Mode], Optional[PurePath]]:
+    def cont() -> Iterator[FrozenSet[Mode]]:
+        for st_mode in range(0o10000):
+            modes = frozenset(
+                mode for bit, mode in _FILE_MODES.items() if st_mode & bit == bit
+            )
+            yield interned.setdefault(modes, modes)
+
+    return tuple(cont())
+
+
+# indexed by the low 12 permission bits of `st_mode`
+_PERM_LUT = _perm_lut()
+# keyed by `S_IFMT(st_mode)`, `S_IFDOOR` is 0 off Solaris
+_TYPE_LUT: Mapping[int, FrozenSet[Mode]] = {
+    bit: frozenset((mode,)) for bit, mode in _FILE_TYPES.items() if bit
+}
+_NO_MODES: FrozenSet[Mode] = frozenset()
+_ORPHAN = frozenset((Mode.orphan_link,))
+# keyed by (st_mode, multi hardlink, link), only a handful ever show up
+_MODES: MutableMapping[Tuple[int, bool, bool], FrozenSet[Mode]] = {}
+
+_Entry = Tuple[PurePath, Optional["DirEntry[str]"]]
+
+_T = TypeVar("_T")
+
+_POOL = ThreadPoolExecutor(max_workers=min(32, (cpu_count() or 1) * 4))
+
+
+async def _run(f: Callable[[], _T]) -> _T:
+    return await get_running_loop().run_in_executor(_POOL, f)
+
+
+def _fs_modes(stat: stat_result, link: bool) -> FrozenSet[Mode]:
+    st_mode, hardlink = stat.st_mode, stat.st_nlink > 1
+    if (modes := _MODES.get((st_mode, hardlink, link))) is None:
+        acc = {
+            *_PERM_LUT[st_mode & 0o7777],
+            *_TYPE_LUT.get(S_IFMT(st_mode), _NO_MODES),
+        }
+        if hardlink:
+            acc.add(Mode.multi_hardlink)
+        if link:
+            acc.add(Mode.link)
+        modes = _MODES.setdefault((st_mode, hardlink, link), frozenset(acc))
+    return modes
+
+
+def _cached_stat(
+    stat_cache: StatCache, path: PurePath, get: Callable[[], stat_result]
+) -> stat_result:
+    if path in stat_cache:
+        if (info := stat_cache[path]) is None:
+            raise FileNotFoundError(path)
+        else:
+            return info
+    else:
         try:
-            info = stat(path, follow_symlinks=False)
+            info = get()
         except FileNotFoundError:
-            return {Mode.orphan_link}, None
+            stat_cache[path] = None
+            raise
         else:
-            if S_ISLNK(info.st_mode):
-                try:
-                    pointed = Path(path).resolve(strict=True)
-                    link_info = stat(pointed, follow_symlinks=False)
-                except (FileNotFoundError, NotADirectoryError, RuntimeError):
-                    return {Mode.orphan_link}, None
+            stat_cache[path] = info
+            return info
+
+
+def _fs_stat(
+    path: PurePath,
+    entry: Optional["DirEntry[str]"],
+    show_modes: bool,
+    stat_cache: StatCache,
+) -> Tuple[AbstractSet[Mode], Optional[PurePath]]:
+    if entry and not show_modes and not entry.is_symlink():
+        if entry.is_dir(follow_symlinks=False):
+            return _TYPE_LUT[S_IFDIR], None
+        elif entry.is_file(follow_symlinks=False):
+            return _TYPE_LUT[S_IFREG], None
+
+    try:
+        info = _cached_stat(
+            stat_cache,
+            path=path,
+            get=lambda: (
+                entry.stat(follow_symlinks=False)
+                if entry
+                else stat(path, follow_symlinks=False)
+            ),
+        )
+    except FileNotFoundError:
+        return _ORPHAN, None
+    else:
+        if S_ISLNK(info.st_mode):
+            try:
+                pointed = Path(path).resolve(strict=True)
+                link_info = _cached_stat(
+                    stat_cache,
+                    path=pointed,
+                    get=lambda: (
+                        entry.stat(follow_symlinks=True)
+                        if entry
+                        else stat(pointed, follow_symlinks=False)
+                    ),
+                )
+            except (FileNotFoundError, NotADirectoryError, RuntimeError):
+                return _ORPHAN, None
+            except OSError as e:
+                # py3.13+ raises ELOOP, where it used to raise `RuntimeError`
+                if e.errno == ELOOP:
+                    return _ORPHAN, None
                 else:
-                    mode = {*_fs_modes(link_info)}
-                    return mode | {Mode.link}, pointed
+                    raise
             else:
-                mode = {*_fs_modes(info)}
-                return mode, None
-
-    return await to_thread(cont)
+                return _fs_modes(link_info, link=True), pointed
+        elif not show_modes and S_ISDIR(info.st_mode):
+            return _TYPE_LUT[S_IFDIR], None
+        elif not show_modes and S_ISREG(info.st_mode):
+            return _TYPE_LUT[S_IFREG], None
+        else:
+            return _fs_modes(info, link=False), None
 
 
-def _listdir(path: PurePath) -> Iterator[Sequence[PurePath]]:
-    with suppress(NotADirectoryError, FileNotFoundError):
+def _listdir(path: PurePath) -> Iterator[Sequence[_Entry]]:
+    with suppress(NotADirectoryError, FileNotFoundError, PermissionError):
         with scandir(path) as it:
             chunked = chunk(it, WALK_PARALLELISM_FACTOR)
             while True:
                 if chunks := next(chunked, None):
-                    yield tuple(map(PurePath, chunks))
+                    yield tuple((PurePath(entry.path), entry) for entry in chunks)
                 else:
                     break
 
 
 async def _next(
-    roots: Iterable[PurePath], index: Index, acc: Queue, bfs_q: Queue
+    roots: Iterable[_Entry],
+    index: Index,
+    show_modes: bool,
+    stat_cache: StatCache,
+    acc: Queue,
+    bfs_q: Queue,
 ) -> None:
-    for root in roots:
-        with suppress(PermissionError):
-            mode, pointed = await _fs_stat(root)
-            _ancestors = ancestors(root)
-            node = Node(
-                path=root,
-                mode=mode,
-                pointed=pointed,
-                ancestors=_ancestors,
-            )
-            await acc.put(node)
+    def cont() -> Iterator[Tuple[Node, Sequence[Sequence[_Entry]]]]:
+        entries = tuple(roots)
+        if show_modes:
+            missing = tuple(root for root, _ in entries if root not in stat_cache)
+            for path, info in zip(missing, batch_stat(missing) or ()):
+                if info:
+                    stat_cache[path] = info
+
+        # siblings share one ancestors set
+        lineage: MutableMapping[PurePath, AbstractSet[PurePath]] = {}
+        for root, entry in entries:
+            with suppress(PermissionError):
+                mode, pointed = _fs_stat(
+                    root, entry=entry, show_modes=show_modes, stat_cache=stat_cache
+                )
+                if (_ancestors := lineage.get(root.parent)) is None:
+                    _ancestors = lineage[root.parent] = frozenset(ancestors(root))
+
+                is_folder = Mode.folder in mode
+                if root in index:
+                    node = Node(mode, root, pointed, _ancestors, is_folder, {})
+                    yield node, tuple(_listdir(root))
+                else:
+                    yield Node(mode, root, pointed, _ancestors, is_folder), ()
 
-            if root in index:
-                for paths in await to_thread(lambda: tuple(_listdir(root))):
-                    await bfs_q.put(paths)
+    for node, listing in await _run(lambda: tuple(cont())):
+        await acc.put(node)
+        for entries in listing:
+            await bfs_q.put(entries)
 
 
 async def _join(nodes: Queue) -> Node:
@@ -149,61 +267,125 @@ async def _join(nodes: Queue) -> Node:
         return root_node
 
 
-async def _new(root: PurePath, index: Index) -> Node:
+async def _new(
+    root: PurePath, index: Index, show_modes: bool, stat_cache: StatCache
+) -> Node:
     acc: Queue = Queue()
     bfs_q: Queue = Queue()
 
-    async def drain() -> AsyncIterator[Sequence[PurePath]]:
+    async def drain() -> AsyncIterator[Sequence[_Entry]]:
         while not bfs_q.empty():
             yield await bfs_q.get()
 
-    await bfs_q.put((root,))
+    await bfs_q.put(((root, None),))
     while not bfs_q.empty():
         tasks = [
-            _next(paths, index=index, acc=acc, bfs_q=bfs_q) async for paths in drain()
+            _next(
+                paths,
+                index=index,
+                show_modes=show_modes,
+                stat_cache=stat_cache,
+                acc=acc,
+                bfs_q=bfs_q,
+            )
+            async for paths in drain()
         ]
         await gather(*tasks)
 
     return await _join(acc)
 
 
-async def new(root: PurePath, index: Index) -> Node:
+async def new(
+    root: PurePath,
+    *,
+    index: Index,
+    show_modes: bool,
+    stat_cache: Optional[StatCache] = None,
+) -> Node:
     async with lock():
-        return await _new(root, index=index)
+        return await _new(
+            root,
+            index=index,
+            show_modes=show_modes,
+            stat_cache={} if stat_cache is None else stat_cache,
+        )
 
 
-async def _update(root: Node, index: Index, paths: AbstractSet[PurePath]) -> Node:
-    if root.path in paths:
-        return await _new(root.path, index=index)
-    else:
+async def _update(
+    root: Node,
+    index: Index,
+    show_modes: bool,
+    stat_cache: StatCache,
+    paths: AbstractSet[PurePath],
+    parents: AbstractSet[PurePath],
+) -> Node:
+    dirty: MutableSequence[Node] = []
+    # pre-order, every parent comes before its children
+    spine: MutableSequence[Node] = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node.path in paths:
+            dirty.append(node)
+        elif node.path in parents:
+            spine.append(node)
+            stack.extend(node.children.values())
+
+    walked = await gather(
+        *(
+            _new(
+                node.path,
+                index=index,
+                show_modes=show_modes,
+                stat_cache=stat_cache,
+            )
+            for node in dirty
+        )
+    )
+    rebuilt = {node.path: node for node in walked}
+
+    for node in reversed(spine):
         children = {
-            k: await _update(v, index=index, paths=paths)
-            for k, v in root.children.items()
+            path: rebuilt.get(path, child) for path, child in node.children.items()
         }
-        return Node(
-            path=root.path,
-            mode=root.mode,
-            pointed=root.pointed,
-            ancestors=root.ancestors,
-            children=children,
-        )
+        rebuilt[node.path] = node._replace(children=children)
+
+    return rebuilt.get(root.path, root)
 
 
 def user_ignored(node: Node, ignores: Ignored) -> bool:
+    name = node.path.name
     return (
-        node.path.name in ignores.name_exact
-        or any(fnmatch(node.path.name, pattern) for pattern in ignores.name_glob)
+        name in ignores.name_exact
+        or any(fnmatch(name, pattern) for pattern in ignores.name_glob)
         or any(fnmatch(normcase(node.path), pattern) for pattern in ignores.path_glob)
     )
 
 
-async def update(root: Node, *, index: Index, paths: AbstractSet[PurePath]) -> Node:
+async def update(
+    root: Node,
+    *,
+    index: Index,
+    show_modes: bool,
+    paths: AbstractSet[PurePath],
+    stat_cache: Optional[StatCache] = None,
+) -> Node:
+    cache: StatCache = {} if stat_cache is None else stat_cache
     async with lock():
         try:
-            return await _update(root, index=index, paths=paths)
+            return await _update(
+                root,
+                index=index,
+                show_modes=show_modes,
+                stat_cache=cache,
+                paths=paths,
+                parents=ancestors(*paths),
+            )
         except FileNotFoundError:
-            return await _new(root.path, index=index)
+            return await _new(
+                root.path, index=index, show_modes=show_modes, stat_cache=cache
+            )
 
 
 def is_dir(node: Node) -> bool:
-    return Mode.folder in node.mode
+    return node.is_folder
@@ -18,6 +18,9 @@ from typing import AbstractSet, Iterable, Mapping, Optional
 from std2.asyncio import to_thread
 from std2.stat import RW_R__R__, RWXR_XR_X
 
+from ._pathtrie import PathTrie
+from .types import StatCache
+
 _FOLDER_MODE = RWXR_XR_X
 _FILE_MODE = RW_R__R__
 
@@ -27,7 +30,13 @@ def ancestors(*paths: PurePath) -> AbstractSet[PurePath]:
 
 
 def unify_ancestors(paths: AbstractSet[PurePath]) -> AbstractSet[PurePath]:
-    return {p for p in paths if ancestors(p).isdisjoint(paths)}
+    trie, unified = PathTrie(), set()
+    # ancestors always sort before their descendants
+    for path in sorted(paths, key=lambda p: len(p.parts)):
+        if not trie.contains_prefix(path.parts):
+            trie.insert(path.parts)
+            unified.add(path)
+    return unified
 
 
 @dataclass(frozen=True)
@@ -107,23 +116,38 @@ async def resolve(path: PurePath, strict: bool) -> Path:
     return await to_thread(cont)
 
 
-async def exists(path: PurePath, follow: bool) -> bool:
+async def exists(
+    path: PurePath, follow: bool, cache: Optional[StatCache] = None
+) -> bool:
+    # cache only holds lstat results
+    lstat_cache = None if follow else cache
+
     def cont() -> bool:
+        if lstat_cache is not None and path in lstat_cache:
+            return lstat_cache[path] is not None
         try:
-            stat(path, follow_symlinks=follow)
+            info = stat(path, follow_symlinks=follow)
+        except FileNotFoundError:
+            if lstat_cache is not None:
+                lstat_cache[path] = None
+            return False
         except (OSError, ValueError):
             return False
         else:
+            if lstat_cache is not None:
+                lstat_cache[path] = info
             return True
 
     return await to_thread(cont)
 
 
 async def exists_many(
-    paths: Iterable[PurePath], follow: bool
+    paths: Iterable[PurePath], follow: bool, cache: Optional[StatCache] = None
 ) -> Mapping[PurePath, bool]:
     async with lock():
-        existance = await gather(*(exists(path, follow=follow) for path in paths))
+        existance = await gather(
+            *(exists(path, follow=follow, cache=cache) for path in paths)
+        )
     return {path: exi for path, exi in zip(paths, existance)}
 
 
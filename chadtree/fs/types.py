@@ -1,9 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import IntEnum, auto, unique
+from os import stat_result
 from pathlib import PurePath
-from typing import AbstractSet, Mapping, Optional, Sequence
+from types import MappingProxyType
+from typing import AbstractSet, Mapping, MutableMapping, NamedTuple, Optional, Sequence
+
+# lstat results, shared for the duration of a single fs operation / refresh
+# None for paths known not to exist
+StatCache = MutableMapping[PurePath, Optional[stat_result]]
 
 
 # https://github.com/coreutils/coreutils/blob/master/src/ls.c
@@ -31,13 +37,19 @@ class Mode(IntEnum):
     file = auto()
 
 
-@dataclass(frozen=True)
-class Node:
+# shared by every node that is never listed, ie. files & closed folders
+_NO_CHILDREN: Mapping[PurePath, Node] = MappingProxyType({})
+
+
+# NamedTuple over dataclass, no per instance `__dict__`
+class Node(NamedTuple):
     mode: AbstractSet[Mode]
     path: PurePath
     pointed: Optional[PurePath]
     ancestors: AbstractSet[PurePath]
-    children: Mapping[PurePath, Node] = field(default_factory=dict)
+    # `Mode.folder in mode`, precomputed
+    is_folder: bool
+    children: Mapping[PurePath, Node] = _NO_CHILDREN
 
 
 @dataclass(frozen=True)
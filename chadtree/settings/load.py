@@ -55,6 +55,7 @@ class _UserOptions:
     polling_rate: SupportsFloat
     session: bool
     show_hidden: bool
+    show_permission_modes: bool
     version_control: VersionCtlOpts
 
 
@@ -157,6 +158,7 @@ async def initial(specs: Iterable[RPCallable]) -> Settings:
             polling_rate=float(options.polling_rate),
             session=options.session,
             show_hidden=options.show_hidden,
+            show_permission_modes=options.show_permission_modes,
             version_ctl=options.version_control,
             view=view_opts,
             width=view.width,
@@ -22,10 +22,17 @@ def _get_lang(code: Optional[str], fallback: str) -> str:
 class _Lang:
     def __init__(self, specs: MutableMapping[str, str]) -> None:
         self._specs = specs
+        self._plain: MutableMapping[str, str] = {}
 
     def __call__(self, key: str, **kwds: Union[int, float, str]) -> str:
-        spec = self._specs[key]
-        return Template(spec).substitute(kwds)
+        if not kwds and (plain := self._plain.get(key)) is not None:
+            return plain
+        else:
+            spec = self._specs[key]
+            msg = Template(spec).substitute(kwds)
+            if not kwds:
+                self._plain[key] = msg
+            return msg
 
 
 LANG = _Lang({})
@@ -44,3 +51,4 @@ def init(code: Optional[str]) -> None:
 
     specs = decode(safe_load(yml_path.read_text("UTF-8")))
     LANG._specs.update(specs)
+    LANG._plain.clear()
@@ -30,6 +30,7 @@ class Settings:
     profiling: bool
     session: bool
     show_hidden: bool
+    show_permission_modes: bool
     version_ctl: VersionCtlOpts
     view: ViewOptions
     width: int
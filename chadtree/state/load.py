@@ -37,7 +37,7 @@ async def initial(settings: Settings) -> State:
     )
 
     selection: Selection = set()
-    node = await new(cwd, index=index)
+    node = await new(cwd, index=index, show_modes=settings.show_permission_modes)
     vc = VCStatus()
 
     current = None
@@ -5,7 +5,7 @@ from pynvim_pp.types import ExtData
 from std2.types import Void, VoidType, or_else
 
 from ..fs.cartographer import update
-from ..fs.types import Node
+from ..fs.types import Node, StatCache
 from ..nvim.types import Markers
 from ..settings.types import Settings
 from ..version_ctl.types import VCStatus
@@ -31,6 +31,7 @@ async def forward(
     paths: Union[AbstractSet[PurePath], VoidType] = Void,
     window_order: Union[Mapping[ExtData, None], VoidType] = Void,
     session: Union[Session, VoidType] = Void,
+    stat_cache: Optional[StatCache] = None,
 ) -> State:
     new_index = or_else(index, state.index)
     new_selection = or_else(selection, state.selection)
@@ -40,7 +41,13 @@ async def forward(
         Node,
         root
         or (
-            await update(state.root, index=new_index, paths=paths)
+            await update(
+                state.root,
+                index=new_index,
+                show_modes=settings.show_permission_modes,
+                paths=paths,
+                stat_cache=stat_cache,
+            )
             if not isinstance(paths, VoidType)
             else state.root
         ),
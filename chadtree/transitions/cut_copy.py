@@ -1,15 +1,24 @@
-from itertools import chain
+from functools import lru_cache
 from os import linesep
 from pathlib import PurePath
-from typing import AbstractSet, Awaitable, Callable, Mapping, MutableMapping, Optional
+from typing import (
+    AbstractSet,
+    Awaitable,
+    Callable,
+    FrozenSet,
+    Mapping,
+    MutableMapping,
+    MutableSet,
+    Optional,
+)
 
 from pynvim_pp.nvim import Nvim
 from std2 import anext
 from std2.locale import pathsort_key
 
 from ..fs.cartographer import is_dir
-from ..fs.ops import ancestors, copy, cut, exists, unify_ancestors
-from ..fs.types import Node
+from ..fs.ops import ancestors, copy, cut, exists, exists_many, unify_ancestors
+from ..fs.types import Node, StatCache
 from ..lsp.notify import lsp_created, lsp_moved
 from ..registry import rpc
 from ..settings.localization import LANG
@@ -23,6 +32,12 @@ from .shared.wm import kill_buffers
 from .types import Stage
 
 
+@lru_cache(maxsize=1)
+def _unify(selection: FrozenSet[PurePath]) -> AbstractSet[PurePath]:
+    # repeated cut / copy on the same selection
+    return frozenset(unify_ancestors(selection))
+
+
 def _find_dest(src: PurePath, node: Node) -> PurePath:
     parent = node.path if is_dir(node) else node.path.parent
     dst = parent / src.name
@@ -41,7 +56,7 @@ async def _operation(
 ) -> Optional[Stage]:
     node = await anext(indices(state, is_visual=is_visual), None)
     selection = state.selection
-    unified = unify_ancestors(selection)
+    unified = _unify(frozenset(selection))
 
     if not unified or not node:
         await Nvim.write(LANG("nothing_select"), error=True)
@@ -50,10 +65,14 @@ async def _operation(
         await Nvim.write(LANG("operation not permitted on root"), error=True)
         return None
     else:
+        # existence checks only, the prompts below can sit for arbitrarily long
+        stat_cache: StatCache = {}
+        sort_keys = {src: pathsort_key(src) for src in unified}
         pre_operations = {src: _find_dest(src, node) for src in unified}
-        pre_existing = {
-            s: d for s, d in pre_operations.items() if await exists(d, follow=False)
-        }
+        existance = await exists_many(
+            pre_operations.values(), follow=False, cache=stat_cache
+        )
+        pre_existing = {s: d for s, d in pre_operations.items() if existance[d]}
 
         new_operations: MutableMapping[PurePath, PurePath] = {}
         while pre_existing:
@@ -64,7 +83,7 @@ async def _operation(
             if not new_dest:
                 pre_existing[source] = dest
                 break
-            elif await exists(new_dest, follow=False):
+            elif await exists(new_dest, follow=False, cache=stat_cache):
                 pre_existing[source] = new_dest
             else:
                 new_operations[source] = new_dest
@@ -72,9 +91,7 @@ async def _operation(
         if pre_existing:
             msg = linesep.join(
                 f"{display_path(s, state=state)} -> {display_path(d, state=state)}"
-                for s, d in sorted(
-                    pre_existing.items(), key=lambda t: pathsort_key(t[0])
-                )
+                for s, d in sorted(pre_existing.items(), key=lambda t: sort_keys[t[0]])
             )
             await Nvim.write(
                 LANG("paths already exist", operation=op_name, paths=msg),
@@ -83,10 +100,12 @@ async def _operation(
             return None
 
         else:
-            operations = {**pre_operations, **new_operations}
+            pre_operations.update(new_operations)
+            operations = pre_operations
+            sorted_ops = sorted(operations.items(), key=lambda t: sort_keys[t[0]])
             msg = linesep.join(
                 f"{display_path(s, state=state)} -> {display_path(d, state=state)}"
-                for s, d in sorted(operations.items(), key=lambda t: pathsort_key(t[0]))
+                for s, d in sorted_ops
             )
 
             question = LANG("confirm op", operation=op_name, paths=msg)
@@ -105,11 +124,14 @@ async def _operation(
                     await Nvim.write(e, error=True)
                     return await refresh(state, settings=settings)
                 else:
-                    paths = {
-                        p.parent for p in chain(operations.keys(), operations.values())
-                    }
+                    paths: MutableSet[PurePath] = set()
+                    new_selection: MutableSet[PurePath] = set()
+                    for src, dst in operations.items():
+                        paths.add(src.parent)
+                        paths.add(dst.parent)
+                        new_selection.add(dst)
+
                     index = state.index | paths
-                    new_selection = {*operations.values()}
                     new_state = await forward(
                         state,
                         settings=settings,
@@ -117,10 +139,7 @@ async def _operation(
                         selection=new_selection,
                         paths=paths,
                     )
-                    focus = next(
-                        iter(sorted(new_selection, key=pathsort_key)),
-                        None,
-                    )
+                    focus = min(new_selection, key=pathsort_key, default=None)
 
                     if is_move:
                         await kill_buffers(
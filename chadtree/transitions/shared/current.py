@@ -38,7 +38,7 @@ async def new_root(
     indices: AbstractSet[PurePath],
 ) -> State:
     index = state.index | ancestors(new_cwd) | {new_cwd} | indices
-    root = await new(new_cwd, index=index)
+    root = await new(new_cwd, index=index, show_modes=settings.show_permission_modes)
     selection = {path for path in state.selection if root.path in ancestors(path)}
     return await forward(
         state, settings=settings, root=root, selection=selection, index=index
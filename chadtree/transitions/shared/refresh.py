@@ -5,6 +5,7 @@ from pynvim_pp.window import Window
 from std2.types import Void
 
 from ...fs.ops import ancestors, exists_many
+from ...fs.types import StatCache
 from ...nvim.markers import markers
 from ...settings.types import Settings
 from ...state.next import forward
@@ -19,6 +20,7 @@ async def refresh(state: State, settings: Settings) -> Stage:
     paths = {cwd}
     current_ancestors = ancestors(current) if current else set()
     new_current = current if cwd in current_ancestors else None
+    stat_cache: StatCache = {}
 
     index = {
         path
@@ -29,7 +31,7 @@ async def refresh(state: State, settings: Settings) -> Stage:
     selection = {
         selected
         for selected, exists in (
-            await exists_many(state.selection, follow=False)
+            await exists_many(state.selection, follow=False, cache=stat_cache)
         ).items()
         if exists
     }
@@ -50,6 +52,7 @@ async def refresh(state: State, settings: Settings) -> Stage:
         selection=selection,
         markers=mks,
         paths=paths,
+        stat_cache=stat_cache,
         current=new_current or Void,
         window_order=window_order,
     )
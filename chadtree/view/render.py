@@ -67,13 +67,15 @@ def _paint(
     icons = settings.view.icons
     context = settings.view.hl_context
 
-    def search_icon_hl(node: Node, ignored: bool) -> Optional[str]:
+    def search_icon_hl(ext: str, ignored: bool) -> Optional[str]:
         if ignored:
             return context.particular_mappings.ignored
         else:
-            return context.icon_exts.get(node.path.suffix)
+            return context.icon_exts.get(ext)
 
-    def search_text_hl(node: Node, ignored: bool) -> Optional[str]:
+    def search_text_hl(
+        node: Node, basename: str, ext: str, ignored: bool
+    ) -> Optional[str]:
         if ignored:
             return context.particular_mappings.ignored
 
@@ -84,14 +86,14 @@ def _paint(
             elif hl := context.mode_pre.get(mode):
                 return hl
 
-        if hl := context.name_exact.get(node.path.name):
+        if hl := context.name_exact.get(basename):
             return hl
 
         for pattern, hl in context.name_glob.items():
-            if fnmatch(node.path.name, pattern):
+            if fnmatch(basename, pattern):
                 return hl
 
-        if hl := context.ext_exact.get(node.path.suffix):
+        if hl := context.ext_exact.get(ext):
             return hl
 
         for mode in s_modes:
@@ -111,27 +113,23 @@ def _paint(
         yield _gen_spacer(depth)
         yield gen_status(node.path)
 
-    def gen_icon(node: Node) -> Iterator[str]:
+    def gen_icon(node: Node, basename: str, ext: str) -> Iterator[str]:
         yield " "
         if is_dir(node):
             yield icons.folder.open if node.path in index else icons.folder.closed
         else:
             yield (
-                icons.name_exact.get(node.path.name, "")
-                or icons.ext_exact.get(node.path.suffix, "")
+                icons.name_exact.get(basename, "")
+                or icons.ext_exact.get(ext, "")
                 or next(
-                    (
-                        v
-                        for k, v in icons.name_glob.items()
-                        if fnmatch(node.path.name, k)
-                    ),
+                    (v for k, v in icons.name_glob.items() if fnmatch(basename, k)),
                     icons.default_icon,
                 )
             ) if settings.view.use_icons else icons.default_icon
         yield " "
 
-    def gen_name(node: Node) -> Iterator[str]:
-        yield encode_for_display(node.path.name)
+    def gen_name(node: Node, basename: str) -> Iterator[str]:
+        yield encode_for_display(basename)
         if not settings.view.use_icons and is_dir(node):
             yield sep
 
@@ -165,18 +163,26 @@ def _paint(
             )
 
     def gen_highlights(
-        node: Node, pre: str, icon: str, name: str, ignored: bool
+        node: Node,
+        basename: str,
+        ext: str,
+        pre: str,
+        icon: str,
+        name: str,
+        ignored: bool,
     ) -> Iterator[Highlight]:
         icon_begin = len(encode(pre))
         icon_end = icon_begin + len(encode(icon))
         text_begin = icon_end
         text_end = len(encode(name)) + text_begin
 
-        if icon_group := search_icon_hl(node, ignored=ignored):
+        if icon_group := search_icon_hl(ext, ignored=ignored):
             hl = Highlight(group=icon_group, begin=icon_begin, end=icon_end)
             yield hl
 
-        if text_group := search_text_hl(node, ignored=ignored):
+        if text_group := search_text_hl(
+            node, basename=basename, ext=ext, ignored=ignored
+        ):
             hl = Highlight(group=text_group, begin=text_begin, end=text_end)
             yield hl
 
@@ -188,15 +194,26 @@ def _paint(
         if depth and _user_ignored and not show_hidden:
             return None
         else:
+            # `PurePath.name` & `.suffix` are recomputed on every access
+            basename = node.path.name
+            ext = node.path.suffix
             pre = "".join(gen_decor_pre(node, depth=depth))
-            icon = "".join(gen_icon(node))
-            name = "".join(gen_name(node))
+            icon = "".join(gen_icon(node, basename=basename, ext=ext))
+            name = "".join(gen_name(node, basename=basename))
             post = "".join(gen_decor_post(node))
 
             line = f"{pre}{icon}{name}{post}"
             badges = tuple(gen_badges(node.path))
             highlights = tuple(
-                gen_highlights(node, pre=pre, icon=icon, name=name, ignored=ignored)
+                gen_highlights(
+                    node,
+                    basename=basename,
+                    ext=ext,
+                    pre=pre,
+                    icon=icon,
+                    name=name,
+                    ignored=ignored,
+                )
             )
             return line, highlights, badges
 
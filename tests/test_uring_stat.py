@@ -0,0 +1,55 @@
+from os import lstat, mkfifo, symlink
+from pathlib import Path, PurePath
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipUnless
+
+from chadtree.fs._uring_stat import _RING_ENTRIES, _lib, batch_stat
+
+# `st_atime_ns` is left out, reading the dir may bump it
+_FIELDS = (
+    "st_mode",
+    "st_ino",
+    "st_dev",
+    "st_nlink",
+    "st_uid",
+    "st_gid",
+    "st_size",
+    "st_mtime_ns",
+    "st_ctime_ns",
+    "st_blksize",
+    "st_blocks",
+    "st_rdev",
+)
+
+
+@skipUnless(_lib(), "liburing-ffi unavailable")
+class BatchStat(TestCase):
+    def test_matches_lstat(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            # more than one ring's worth
+            for i in range(_RING_ENTRIES + 1):
+                (root / str(i)).write_text(str(i))
+            (root / "folder").mkdir()
+            mkfifo(root / "fifo")
+            symlink(root / "folder", root / "link")
+            symlink(root / "nope", root / "orphan")
+
+            missing = PurePath(root / "missing")
+            paths = [*map(PurePath, sorted(root.iterdir())), missing]
+            stats = batch_stat(paths)
+
+            self.assertIsNotNone(stats)
+            assert stats is not None
+            self.assertEqual(len(stats), len(paths))
+            for path, info in zip(paths, stats):
+                with self.subTest(path=path):
+                    if path == missing:
+                        self.assertIsNone(info)
+                    else:
+                        assert info is not None
+                        expected = lstat(path)
+                        self.assertEqual(
+                            tuple(getattr(info, field) for field in _FIELDS),
+                            tuple(getattr(expected, field) for field in _FIELDS),
+                        )